@@ -1,6 +1,7 @@
 # /sign-controller/boot/splash.py
 #!/usr/bin/env python3
 import time, os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
@@ -17,26 +18,28 @@ def find_logo():
             return Path(p)
     return None
 
+def load_logo():
+    logo_path = find_logo()
+    return Image.open(logo_path).convert("RGBA") if logo_path else None
+
 def scale_to_fit(img, max_w, max_h):
     img = img.copy()
     img.thumbnail((max_w, max_h), Image.LANCZOS)
     return img
 
-def show_splash(matrix, seconds=3):
+def show_splash(matrix, logo, seconds=3):
     bg = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
-    logo_path = find_logo()
-    if logo_path:
-        logo = Image.open(logo_path).convert("RGBA")
+    if logo:
         # Fit logo with padding
         padded = scale_to_fit(logo, matrix.width-8, matrix.height-8)
+        # Flatten onto black once so the frame is plain RGB from here on
+        padded = Image.alpha_composite(Image.new("RGBA", padded.size, (0,0,0,255)), padded).convert("RGB")
         center_image_on(bg, padded)
     push(matrix, bg)
     time.sleep(seconds)
 
-def show_ip(matrix):
+def show_ip(matrix, iface, ip, small):
     bg = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
-    iface, ip = get_primary_ip()
-    small = load_font(16)
     if ip:
         render_text(bg, f"{iface}: {ip}", small, xy=("center","center"))
     else:
@@ -45,9 +48,17 @@ def show_ip(matrix):
     time.sleep(1.5)
 
 def main():
-    m = build_matrix()
-    show_splash(m, 3)
-    show_ip(m)
+    # Decode the logo, load the font and look up the IP while the matrix comes up
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_logo = ex.submit(load_logo)
+        f_font = ex.submit(load_font, 16)
+        f_ip = ex.submit(get_primary_ip)
+        m = build_matrix()
+        show_splash(m, f_logo.result(), 3)
+        iface, ip = f_ip.result()
+        if not ip:  # looked up before the splash; DHCP may have finished since
+            iface, ip = get_primary_ip()
+        show_ip(m, iface, ip, f_font.result())
 
     # Jump to menu
     from modes.menu import run_menu
@@ -46,9 +46,10 @@ Any unrecognized line is ignored gracefully.
 """
 from __future__ import annotations
 import argparse
+import csv
 import json
 import queue
-import select
+import selectors
 import signal
 import socket
 import threading
@@ -64,29 +65,31 @@ except Exception:  # allows dev on non-Pi
     RGBMatrixOptions = object
     graphics = None
 
+# Optional: pre-rendered clock glyphs (falls back to DrawText without these)
+try:
+    import numpy as np
+    from PIL import BdfFontFile, Image
+except Exception:
+    np = None
+
 APP_ROOT = Path(__file__).resolve().parents[1]
 CONF_PATH = APP_ROOT / "config" / "settings.json"
 FONTS_DIR = APP_ROOT / "ledlib" / "fonts"
+CLOCK_CHARS = "0123456789:."
+MAX_LINES_PER_FRAME = 64  # cap the queue drain so a burst can't starve rendering
 
 # --------------------------- parsing helpers ---------------------------
 
 def parse_csv_line(line: str) -> List[str]:
-    out, field, in_quotes = [], [], False
-    i = 0
-    while i < len(line):
-        c = line[i]
-        if c == '"':
-            if in_quotes and i + 1 < len(line) and line[i + 1] == '"':
-                field.append('"'); i += 1
-            else:
-                in_quotes = not in_quotes
-        elif c == ',' and not in_quotes:
-            out.append(''.join(field).strip()); field = []
-        else:
-            field.append(c)
-        i += 1
-    out.append(''.join(field).strip())
-    return out
+    # csv's C parser handles quoting and "" escapes the same way Lynx emits them
+    try:
+        return [f.strip() for f in next(csv.reader([line], skipinitialspace=True))]
+    except StopIteration:
+        return []
+
+def is_clock_line(line: str) -> bool:
+    # Cheap TM check without a full CSV parse
+    return line[:3].upper() == 'TM,' or line.upper() == 'TM'
 
 # --------------------------- state ---------------------------
 
@@ -99,6 +102,7 @@ class State:
         self.results: List[Tuple[str,str]] = []  # [(place, mark)] where name is implied by last field
         self.results_names: List[str] = []       # [last_name]
         self.result_index = 0
+        self.dirty = True    # set whenever the display needs a redraw
 
     def clear(self):
         self.__init__()
@@ -119,13 +123,19 @@ class Renderer:
         opts.gpio_slowdown = int(settings.get("led_gpio_slowdown", 2))
         opts.hardware_mapping = settings.get("led_hardware_mapping", "regular")
         self.matrix = RGBMatrix(options=opts)
+        # Double buffer: allocate once, SwapOnVSync hands back the offscreen one
+        self._canvas_a = self.matrix.CreateFrameCanvas()
+        self._canvas_b = self.matrix.CreateFrameCanvas()
+        self._back = self._canvas_a
         # Fonts
         self.font_title = graphics.Font(); self.font_title.LoadFont(str(FONTS_DIR / "10x20.bdf"))
         # Try large clock font; fall back if missing
         self.font_clock = graphics.Font()
+        clock_path = None
         for cand in ["16x27.bdf", "14x26.bdf", "13x24.bdf", "10x20.bdf"]:
             try:
                 self.font_clock.LoadFont(str(FONTS_DIR / cand))
+                clock_path = FONTS_DIR / cand
                 break
             except Exception:
                 continue
@@ -133,49 +143,105 @@ class Renderer:
         # Colors
         self.white = graphics.Color(255,255,255)
         self.green = graphics.Color(0,255,0)
+        # Per-font glyph widths so text can be measured without drawing it
+        self._char_w = {}
+        for font in (self.font_title, self.font_clock, self.font_small):
+            self._char_w[id(font)] = {
+                chr(c): max(0, font.CharacterWidth(c)) for c in range(32, 127)
+            }
+        # Clock glyph atlas: {char: uint8[H,W,3]}, composed into a reused strip
+        self._clock_glyphs = {}
+        self._clock_ascent = 0
+        self._clock_buf = None
+        if np is not None and clock_path is not None:
+            try:
+                self._build_clock_atlas(clock_path)
+            except Exception:
+                self._clock_glyphs = {}
+
+    def _build_clock_atlas(self, path: Path):
+        with open(path, "rb") as fp:
+            bdf = BdfFontFile.BdfFontFile(fp)
+        glyphs = [bdf.glyph[ord(ch)] for ch in CLOCK_CHARS]
+        if any(g is None for g in glyphs):
+            return
+        # dst bbox is relative to the baseline (negative y is above it)
+        ascent = max(-g[1][1] for g in glyphs)
+        descent = max(g[1][3] for g in glyphs)
+        height = ascent + descent
+        for ch, (xy, dst, _src, im) in zip(CLOCK_CHARS, glyphs):
+            x0, y0 = max(0, dst[0]), ascent + dst[1]
+            mask = np.array(im, dtype=bool)
+            gh, gw = mask.shape
+            cell = np.zeros((height, max(xy[0], x0 + gw), 3), dtype=np.uint8)
+            cell[y0:y0+gh, x0:x0+gw][mask] = 255
+            self._clock_glyphs[ch] = cell
+        self._clock_ascent = ascent
+        self._clock_buf = np.zeros((height, self.matrix.width, 3), dtype=np.uint8)
+
+    def _draw_clock(self, canvas, text: str, y: int):
+        # Blit pre-rendered glyphs when every char is in the atlas
+        if not text: return
+        glyphs = self._clock_glyphs
+        if not glyphs or any(ch not in glyphs for ch in text):
+            self._center_text(canvas, self.font_clock, text, y)
+            return
+        buf = self._clock_buf
+        buf[:] = 0
+        w = buf.shape[1]
+        total = sum(glyphs[ch].shape[1] for ch in text)
+        x = max(0, (w - total)//2)
+        for ch in text:
+            g = glyphs[ch]
+            gw = min(g.shape[1], w - x)
+            if gw <= 0: break
+            np.copyto(buf[:, x:x+gw], g[:, :gw])
+            x += g.shape[1]
+        canvas.SetImage(Image.fromarray(buf), 0, y - self._clock_ascent)
+
+    def _text_width(self, font, text: str) -> int:
+        widths = self._char_w[id(font)]
+        return sum(widths[ch] if ch in widths else max(0, font.CharacterWidth(ord(ch)))
+                   for ch in text)
 
     def _center_text(self, canvas, font, text: str, y: int, color=None):
         if not text: return 0
         if color is None: color = self.white
-        width = graphics.DrawText(canvas, font, 0, y, color, text)
-        w = self.matrix.width
-        if width < w:
-            canvas.Clear()
-            x = (w - width)//2
-            graphics.DrawText(canvas, font, x, y, color, text)
-            return width
+        width = self._text_width(font, text)
+        x = max(0, (self.matrix.width - width)//2)
+        graphics.DrawText(canvas, font, x, y, color, text)
         return width
 
     def render_header(self, st: State):
-        canvas = self.matrix.CreateFrameCanvas()
+        canvas = self._back; canvas.Clear()
         h = self.matrix.height
+        # Big clock centered (drawn first: the glyph strip overwrites its rows)
+        # place the baseline so digits are vertically centered
+        self._draw_clock(canvas, st.clock, 46)
         # Event title on top
         self._center_text(canvas, self.font_title, st.event, 18)
         # Optional heat info small (right-aligned-ish)
         small = st.heat
         if small:
             graphics.DrawText(canvas, self.font_small, 2, h-2, self.white, small)
-        # Big clock centered
-        # place the baseline so digits are vertically centered
-        self._center_text(canvas, self.font_clock, st.clock, 46)
-        self.matrix.SwapOnVSync(canvas)
+        self._back = self.matrix.SwapOnVSync(canvas)
 
     def render_results(self, st: State):
-        canvas = self.matrix.CreateFrameCanvas()
+        canvas = self._back; canvas.Clear()
         w, h = self.matrix.width, self.matrix.height
         if not st.results:
             self.render_header(st); return
         i = st.result_index % len(st.results)
         place, mark = st.results[i]
         last = st.results_names[i]
+        # Time under the bar, big (drawn first: the glyph strip overwrites its rows)
+        self._draw_clock(canvas, mark, 58)
         # Top line: "1 - Riley"
         top = f"{place} - {last}"
         self._center_text(canvas, self.font_title, top, 20)
         # Green thin bar
         graphics.DrawLine(canvas, 0, 28, w-1, 28, self.green)
-        # Time under it, big
-        self._center_text(canvas, self.font_clock, mark, 58)
-        self.matrix.SwapOnVSync(canvas)
+        self._back = self.matrix.SwapOnVSync(canvas)
 
     def render(self, st: State):
         if st.mode == "RESULTS":
@@ -194,7 +260,7 @@ class Receiver(threading.Thread):
         super().__init__(daemon=True)
         self.port = port
         self.udp = udp
-        self.q: "queue.Queue[str]" = queue.Queue()
+        self.q: "queue.SimpleQueue[str]" = queue.SimpleQueue()
         self.stop_evt = threading.Event()
 
     def run(self):
@@ -203,16 +269,47 @@ class Receiver(threading.Thread):
         else:
             self._run_tcp()
 
+    def _put_lines(self, data: bytes):
+        for line in data.decode(errors='ignore').splitlines():
+            self.q.put(line.strip())
+
     def _run_udp(self):
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # room for a burst of datagrams between wakeups
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
         sock.bind(("0.0.0.0", self.port))
         sock.setblocking(False)
+        sel = selectors.DefaultSelector()
+        sel.register(sock, selectors.EVENT_READ)
         while not self.stop_evt.is_set():
-            r,_,_ = select.select([sock],[],[],0.25)
-            if sock in r:
-                data, _addr = sock.recvfrom(65535)
-                for line in data.decode(errors='ignore').splitlines():
-                    self.q.put(line.strip())
+            if sel.select(0.25):
+                # drain every queued datagram before going back to select
+                while True:
+                    try:
+                        data, _addr = sock.recvfrom(65535)
+                    except BlockingIOError:
+                        break
+                    self._put_lines(data)
+        sel.close(); sock.close()
+
+    def _drain_conn(self, sel, c):
+        try:
+            # read until EAGAIN so one wakeup drains the socket
+            chunks, closed = [], False
+            while True:
+                try:
+                    data = c.recv(4096)
+                except BlockingIOError:
+                    break
+                if not data:
+                    closed = True; break
+                chunks.append(data)
+            if chunks:
+                self._put_lines(b"".join(chunks))
+        except Exception:
+            closed = True
+        if closed:
+            sel.unregister(c); c.close()
 
     def _run_tcp(self):
         server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -220,21 +317,19 @@ class Receiver(threading.Thread):
         server.bind(("0.0.0.0", self.port))
         server.listen(5)
         server.setblocking(False)
-        conns = []
+        # epoll on Linux: registered once, no fd list rebuilt per wakeup
+        sel = selectors.DefaultSelector()
+        sel.register(server, selectors.EVENT_READ)
         while not self.stop_evt.is_set():
-            r,_,_ = select.select([server] + conns, [], [], 0.25)
-            if server in r:
-                conn, _ = server.accept(); conn.setblocking(False); conns.append(conn)
-            for c in list(conns):
-                if c in r:
-                    try:
-                        data = c.recv(4096)
-                        if not data:
-                            conns.remove(c); c.close(); continue
-                        for line in data.decode(errors='ignore').splitlines():
-                            self.q.put(line.strip())
-                    except Exception:
-                        conns.remove(c); c.close()
+            for key, _ in sel.select(0.25):
+                if key.fileobj is server:
+                    conn, _ = server.accept(); conn.setblocking(False)
+                    sel.register(conn, selectors.EVENT_READ)
+                else:
+                    self._drain_conn(sel, key.fileobj)
+        for key in list(sel.get_map().values()):
+            key.fileobj.close()
+        sel.close()
 
 # --------------------------- application logic ---------------------------
 
@@ -254,6 +349,7 @@ def apply_message(st: State, line: str):
         st.heat = heat if heat else ''
         st.clock = "0:00"  # show armed/cleared clock
         st.mode = 'HEADER'
+        st.dirty = True
         return
 
     if tag == 'TM':
@@ -261,6 +357,7 @@ def apply_message(st: State, line: str):
         st.clock = parts[1] if len(parts) > 1 else st.clock
         # stay in HEADER mode while timing
         st.mode = 'HEADER'
+        st.dirty = True
         return
 
     if tag == 'SRMODE':
@@ -268,6 +365,7 @@ def apply_message(st: State, line: str):
             st.mode = 'RESULTS'; st.result_index = 0
         elif len(parts) > 1 and parts[1].upper() == 'END':
             st.mode = 'HEADER'
+        st.dirty = True
         return
 
     if tag == 'SR':
@@ -281,6 +379,7 @@ def apply_message(st: State, line: str):
         st.results = st.results[-16:]
         st.results_names = st.results_names[-16:]
         st.mode = 'RESULTS'
+        st.dirty = True
         return
 
     if tag == 'TX':
@@ -288,6 +387,7 @@ def apply_message(st: State, line: str):
         st.event = parts[1] if len(parts) > 1 else st.event
         st.heat = ''
         st.mode = 'HEADER'
+        st.dirty = True
         return
 
     # ignore unknown
@@ -300,6 +400,7 @@ def main(argv=None):
     ap.add_argument('--tcp', action='store_true', help='listen via TCP')
     ap.add_argument('--fps', type=float, default=20.0)
     ap.add_argument('--result-rotate-sec', type=float, default=2.0)
+    ap.add_argument('--debug', action='store_true', help='log messages drained per frame')
     args = ap.parse_args(argv)
 
     udp = not args.tcp
@@ -319,27 +420,50 @@ def main(argv=None):
     signal.signal(signal.SIGINT, _sig)
     signal.signal(signal.SIGTERM, _sig)
 
-    next_rotate = time.time() + args.result_rotate_sec
+    next_rotate = time.monotonic() + args.result_rotate_sec
     frame_delay = 1.0 / max(5.0, args.fps)
+    next_frame = time.monotonic() + frame_delay
+    last_draw = 0.0
 
     while running:
-        try:
-            while True:
-                line = recv.q.get_nowait()
-                apply_message(st, line)
-        except queue.Empty:
-            pass
+        batch = []
+        for _ in range(MAX_LINES_PER_FRAME):
+            try:
+                batch.append(recv.q.get_nowait())
+            except queue.Empty:
+                break
+        lines_in_frame = len(batch)
+        # Within a run of consecutive TM updates only the last one is visible
+        for i, line in enumerate(batch):
+            if is_clock_line(line) and i + 1 < len(batch) and is_clock_line(batch[i + 1]):
+                continue
+            apply_message(st, line)
+        if args.debug and lines_in_frame:
+            print(f"frame: {lines_in_frame} line(s), backlog {recv.q.qsize()}", flush=True)
 
-        now = time.time()
+        now = time.monotonic()
         if st.mode == 'RESULTS' and st.results:
             if now >= next_rotate:
                 st.result_index += 1
+                st.dirty = True
                 next_rotate = now + args.result_rotate_sec
         else:
             next_rotate = now + args.result_rotate_sec
 
-        renderer.render(st)
-        time.sleep(frame_delay)
+        # Only redraw on change; the watchdog recovers from a missed flag
+        if st.dirty or now - last_draw > 1.0:
+            renderer.render(st)
+            st.dirty = False
+            last_draw = now
+
+        # Pace against a fixed deadline so render time doesn't stretch the frame
+        now = time.monotonic()
+        sleep_for = next_frame - now
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+        else:
+            next_frame = now  # fell behind; resync instead of bursting
+        next_frame += frame_delay
 
 if __name__ == '__main__':
     main()
@@ -1,14 +1,14 @@
 # /sign-controller/modes/lap_counter.py
-import time, sys, select
 from PIL import Image, ImageDraw
-from .matrix_utils import load_font, push
+from .matrix_utils import load_font, push, get_key
 
 def run_lap_counter(matrix):
     n = 0
     big = load_font(56)
+    img = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
+    draw = ImageDraw.Draw(img)
     def render():
-        img = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
-        draw = ImageDraw.Draw(img)
+        draw.rectangle((0,0,matrix.width,matrix.height), fill=(0,0,0))
         text = str(n)
         w = draw.textlength(text, font=big)
         draw.text(((matrix.width - w)//2, (matrix.height - big.size)//2),
@@ -18,9 +18,9 @@ def run_lap_counter(matrix):
     render()
     paused = False
     while True:
-        c = _getch()
+        c = get_key()
         if not c:
-            time.sleep(0.03); continue
+            continue
         if c in ('\r','\n','+'):
             n += 1; render()
         elif c in ('-','_'):
@@ -29,8 +29,3 @@ def run_lap_counter(matrix):
             n = 0; render()
         elif c == '\x1b':  # ESC → back to menu
             return
-
-def _getch(timeout=0.05):
-    dr,_,_ = select.select([sys.stdin], [], [], timeout)
-    if not dr: return None
-    return sys.stdin.read(1)
@@ -1,5 +1,6 @@
 # /sign-controller/modes/matrix_utils.py
-import json, socket, fcntl, struct, os, time
+import json, socket, fcntl, struct, os, time, sys, queue, threading
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
@@ -9,6 +10,8 @@ APP_ROOT = Path(__file__).resolve().parents[1]
 CONF_PATH = APP_ROOT / "config" / "settings.json"
 
 # ---- Fonts (use built-in if TTF missing) ----
+# Cached: truetype() re-reads and parses the file on every call
+@lru_cache(maxsize=16)
 def load_font(size=12, fallback=True):
     # Try a decent TTF if present; else built-in 6x10 scaled by Pillow
     ttfs = [
@@ -42,10 +45,51 @@ def build_matrix():
     return RGBMatrix(options=options)
 
 def canvas_image(matrix):
-    # Return a PIL image sized to the matrix
-    width  = matrix.width
-    height = matrix.height
-    return Image.new("RGB", (width, height)), ImageDraw.Draw(Image.new("RGB", (width, height)))
+    # Return a PIL image sized to the matrix and a draw context bound to it
+    img = Image.new("RGB", (matrix.width, matrix.height))
+    return img, ImageDraw.Draw(img)
+
+# (width, height) -> (img, draw), shared by high-cadence renderers
+_FRAME_CACHE = {}
+
+def canvas_image_reuse(matrix):
+    # Like canvas_image, but hands back the same image each call, cleared to black
+    key = (matrix.width, matrix.height)
+    frame = _FRAME_CACHE.get(key)
+    if frame is None:
+        frame = _FRAME_CACHE[key] = canvas_image(matrix)
+    else:
+        frame[1].rectangle((0,0,matrix.width,matrix.height), fill=(0,0,0))
+    return frame
+
+# ---- Keyboard: one reader thread feeds every mode ----
+_key_q = queue.SimpleQueue()
+_key_thread = None
+_key_lock = threading.Lock()
+
+def _key_reader():
+    while True:
+        c = sys.stdin.read(1)
+        if not c:  # EOF
+            return
+        _key_q.put(c)
+
+def get_key(timeout=None):
+    """
+    Next keypress, or None if none arrives within `timeout` seconds
+    (0 = don't wait, None = wait forever). Starts the reader on first use.
+    """
+    global _key_thread
+    with _key_lock:
+        if _key_thread is None:
+            _key_thread = threading.Thread(target=_key_reader, daemon=True)
+            _key_thread.start()
+    try:
+        if timeout == 0:
+            return _key_q.get_nowait()
+        return _key_q.get(timeout=timeout)
+    except queue.Empty:
+        return None
 
 def get_primary_ip():
     """
@@ -73,15 +117,23 @@ def iface_ipv4(ifname):
         return None
 
 def center_image_on(img_bg, img_fg):
+    # RGBA foregrounds use their alpha as the paste mask; RGB ones paste opaque
     bg_w, bg_h = img_bg.size
     fg_w, fg_h = img_fg.size
     x = (bg_w - fg_w)//2
     y = (bg_h - fg_h)//2
     img_bg.paste(img_fg, (x, y), img_fg if img_fg.mode == "RGBA" else None)
 
+# (id(font), text) -> textbbox; fonts come from load_font's cache so ids are stable
+_BBOX_CACHE = {}
+
 def render_text(img, text, font, fill=(255,255,255), xy=("center","center")):
     draw = ImageDraw.Draw(img)
-    w, h = draw.textbbox((0,0), text, font=font)[2:]
+    k = (id(font), text)
+    bb = _BBOX_CACHE.get(k)
+    if bb is None:
+        bb = _BBOX_CACHE[k] = draw.textbbox((0,0), text, font=font)
+    w, h = bb[2:]
     if xy[0] == "center": x = (img.width - w)//2
     else: x = xy[0]
     if xy[1] == "center": y = (img.height - h)//2
@@ -90,4 +142,8 @@ def render_text(img, text, font, fill=(255,255,255), xy=("center","center")):
     return (x, y, w, h)
 
 def push(matrix, img):
-    matrix.SetImage(img.convert("RGB"))
+    # All mode frames are already RGB; only convert the odd one that isn't
+    if img.mode == "RGB":
+        matrix.SetImage(img)
+    else:
+        matrix.SetImage(img.convert("RGB"))
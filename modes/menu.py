@@ -1,15 +1,10 @@
 # /sign-controller/modes/menu.py
-import time, sys, termios, tty, select
+import time, sys, termios, tty
 from PIL import Image, ImageDraw
-from .matrix_utils import load_font, push
+from .matrix_utils import load_font, push, get_key
 
 MENU = ["FinishLynx", "Clock Up", "Clock Down", "Lap Count", "Rounds"]
 
-def getch(timeout=0.05):
-    dr,dw,de = select.select([sys.stdin], [], [], timeout)
-    if not dr: return None
-    return sys.stdin.read(1)
-
 def run_menu(matrix):
     # prepare raw terminal
     fd = sys.stdin.fileno()
@@ -19,24 +14,30 @@ def run_menu(matrix):
         idx = 0
         small = load_font(14)
         title = load_font(16)
+        # MENU is static: draw title + labels once, overlay only the selection
+        prefix_w = small.getlength("> ")
+        widths = [small.getlength("> " + item) for item in MENU]
+        base = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
+        base_draw = ImageDraw.Draw(base)
+        # Title
+        base_draw.text((4, 2), "Select Mode", font=title, fill=(255,255,255))
+        # Items
+        item_ys = []
+        y = 22
+        for item in MENU:
+            base_draw.text((8 + prefix_w, y), item, font=small, fill=(255,255,255))
+            item_ys.append(y)
+            y += small.size + 6
         while True:
-            img = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
+            img = base.copy()
             draw = ImageDraw.Draw(img)
-            # Title
-            draw.text((4, 2), "Select Mode", font=title, fill=(255,255,255))
-            # Items
-            y = 22
-            for i, item in enumerate(MENU):
-                prefix = "> " if i == idx else "  "
-                draw.text((8, y), prefix + item, font=small, fill=(255,255,255))
-                if i == idx:
-                    w = draw.textlength(prefix + item, font=small)
-                    draw.line((8, y+small.size+1, 8+w, y+small.size+1), fill=(255,255,255), width=1)
-                y += small.size + 6
+            y = item_ys[idx]
+            draw.text((8, y), ">", font=small, fill=(255,255,255))
+            draw.line((8, y+small.size+1, 8+widths[idx], y+small.size+1), fill=(255,255,255), width=1)
 
             push(matrix, img)
 
-            c = getch(0.12)
+            c = get_key(0.12)
             if not c:
                 continue
             if c in ("\x1b",):  # ESC → could exit or ignore here
@@ -70,6 +71,6 @@ def run_menu(matrix):
             # Consume ANSI escape sequences for arrows if needed
             elif c == '\x1b':
                 # read rest of escape if present
-                _ = sys.stdin.read(2) if select.select([sys.stdin], [], [], 0)[0] else None
+                _ = get_key(0), get_key(0)
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old)
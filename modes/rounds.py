@@ -1,7 +1,7 @@
 # /sign-controller/modes/rounds.py
-import time, sys, select
+import time
 from PIL import Image, ImageDraw
-from .matrix_utils import load_font, push
+from .matrix_utils import load_font, push, get_key
 from .timer_modes import collect_hhmmss, fmt_hhmmss
 
 def run_rounds(matrix):
@@ -11,14 +11,16 @@ def run_rounds(matrix):
     last_second_flash = False
 
     running = True
+    big = load_font(48)
+    img = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
+    draw = ImageDraw.Draw(img)
+    # One running deadline across rounds keeps N rounds == N*length wall time
+    deadline = time.monotonic() + 1.0
     while True:
-        start = time.monotonic()
         remaining = length
         while remaining > 0:
             # Last second: flash border in red
-            img = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
-            draw = ImageDraw.Draw(img)
-            big = load_font(48)
+            draw.rectangle((0,0,matrix.width,matrix.height), fill=(0,0,0))
             t = fmt_hhmmss(remaining)
             w = draw.textlength(t, font=big)
             draw.text(((matrix.width - w)//2, (matrix.height - big.size)//2), t, font=big, fill=(255,255,255))
@@ -29,18 +31,20 @@ def run_rounds(matrix):
 
             push(matrix, img)
 
-            # Keys: ESC pauses then ESC again exits to menu
-            c = _getch(0.2)
-            if c == '\x1b':
-                # pause
-                if not _pause_screen(matrix):  # False means user chose to exit
-                    return
+            # Sleep until the next tick, waking immediately on a key
+            c = get_key(max(0, deadline - time.monotonic()))
+            if c:
+                # Keys: ESC pauses then ESC again exits to menu
+                if c == '\x1b':
+                    # pause
+                    paused_at = time.monotonic()
+                    if not _pause_screen(matrix):  # False means user chose to exit
+                        return
+                    deadline += time.monotonic() - paused_at
+                continue  # redraw; only tick once the deadline passes
 
             # tick
-            now = time.monotonic()
-            sleep_left = 1.0 - (now - start)
-            if sleep_left > 0: time.sleep(sleep_left)
-            start += 1.0
+            deadline += 1.0
             remaining -= 1
 
         # Immediately restart, to ensure N * length == exact wall time N*length
@@ -57,13 +61,8 @@ def _pause_screen(matrix):
     push(matrix, img)
     # Wait for key
     while True:
-        c = _getch(0.1)
+        c = get_key(0.1)
         if c in ('\r','\n'):
             return True
         if c == '\x1b':
             return False
-
-def _getch(timeout=0.05):
-    dr,_,_ = select.select([sys.stdin], [], [], timeout)
-    if not dr: return None
-    return sys.stdin.read(1)
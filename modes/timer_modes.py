@@ -1,16 +1,12 @@
 # /sign-controller/modes/timer_modes.py
-import time, sys, termios, tty, select
+import time, sys, termios, tty
 from datetime import timedelta
-from PIL import Image, ImageDraw
-from .matrix_utils import load_font, push
+from functools import lru_cache
+from .matrix_utils import load_font, push, get_key, canvas_image_reuse
 
 DIR_UP, DIR_DOWN = 1, -1
 
-def getch(timeout=0.05):
-    dr,dw,de = select.select([sys.stdin], [], [], timeout)
-    if not dr: return None
-    return sys.stdin.read(1)
-
+@lru_cache(maxsize=4096)  # countdowns revisit the same few thousand values
 def fmt_hhmmss(total_seconds):
     if total_seconds < 0: total_seconds = 0
     h = total_seconds // 3600
@@ -22,11 +18,12 @@ def collect_hhmmss(matrix, prompt="Set Time (HHMMSS)"):
     digits = ""
     big = load_font(46)   # large time
     med = load_font(18)
+    # HH:MM:SS is always 6 digits + 2 colons, so the preview's x never changes
+    total_w = 6*big.getlength("0") + 2*big.getlength(":")
+    x = (matrix.width - total_w)//2
     while True:
-        img = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
-        draw = ImageDraw.Draw(img)
+        img, draw = canvas_image_reuse(matrix)
         draw.text((8, 6), prompt, font=med, fill=(255,255,255))
-        disp = digits.ljust(6, "_")
         # Show formatted live preview
         if len(digits) >= 1:
             hh = int(digits[0:2] or 0) if len(digits)>=2 else int(digits[0])
@@ -35,11 +32,11 @@ def collect_hhmmss(matrix, prompt="Set Time (HHMMSS)"):
         else:
             hh = int(digits[0:2] or 0); mm = int(digits[2:4] or 0); ss = int(digits[4:6] or 0)
         preview = f"{hh:02d}:{mm:02d}:{ss:02d}"
-        w = draw.textlength(preview, font=big)
-        draw.text(((matrix.width - w)//2, 24), preview, font=big, fill=(255,255,255))
+        draw.text((x, 24), preview, font=big, fill=(255,255,255))
         push(matrix, img)
 
-        c = getch(0.15)
+        # Nothing on this screen changes without a key, so block until one
+        c = get_key()
         if not c: continue
         if c.isdigit() and len(digits) < 6:
             digits += c
@@ -56,8 +53,7 @@ def collect_hhmmss(matrix, prompt="Set Time (HHMMSS)"):
 
 def draw_time(matrix, seconds):
     big = load_font(48)  # try to fill height on 64px
-    img = Image.new("RGB", (matrix.width, matrix.height), (0,0,0))
-    draw = ImageDraw.Draw(img)
+    img, draw = canvas_image_reuse(matrix)
     t = fmt_hhmmss(seconds)
     w = draw.textlength(t, font=big)
     draw.text(((matrix.width - w)//2, (matrix.height - big.size)//2), t, font=big, fill=(255,255,255))
@@ -80,11 +76,15 @@ def run_clock(matrix, direction=DIR_UP):
     # Controls: Enter = start/pause toggle, Space = pause, ESC = pause/exit, R = reset to 0
     running = False
     while True:
+        # Sleep until the next tick (or until a key while stopped)
+        timeout = max(0, last + 1.0 - time.monotonic()) if running else None
         # Input handling
-        c = _get_key_nonblock()
+        c = get_key(timeout)
         if c:
             if c in ('\r','\n'):  # Enter -> toggle run
                 running = not running
+                if running:
+                    last = time.monotonic()  # don't count time spent stopped
             elif c in (' ','p','P'):
                 running = False
             elif c in ('r','R'):
@@ -107,11 +107,3 @@ def run_clock(matrix, direction=DIR_UP):
                 cur = 0
                 running = False  # stop at 0, per spec
             draw_time(matrix, cur)
-        else:
-            time.sleep(0.02)
-
-def _get_key_nonblock():
-    import select, sys
-    dr,_,_ = select.select([sys.stdin], [], [], 0)
-    if not dr: return None
-    return sys.stdin.read(1)
@@ -129,7 +129,7 @@ if [ ! -d "${ROOT_DIR}/venv" ]; then
 fi
 "${PIP}" install --upgrade pip wheel
 # base deps for the web ui and common utils
-"${PIP}" install flask waitress pillow werkzeug
+"${PIP}" install flask waitress pillow numpy werkzeug
 
 # -------- clone/update web repo (LEDSign_Site) -> ${WEB_DIR} --------
 if [ ! -d "${WEB_DIR}/.git" ]; then